@@ -18,7 +18,22 @@ from dataclasses import dataclass
 from typing import Iterable, List, Sequence
 
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401 - only probed to pick the BeautifulSoup tree builder
+except ImportError:  # pragma: no cover - optional dependency
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 BASE_URL = "https://extapps.ksc.nasa.gov/NSLSL"
 SEARCH_ROOT = f"{BASE_URL}/Search"
@@ -30,9 +45,19 @@ DEFAULT_USER_AGENT = "NSLSLTitleFetcher/1.0"
 REQUEST_TIMEOUT = 120  # seconds
 REQUEST_DELAY = 0.3    # courtesy pause between page fetches
 MAX_RETRIES = 3
+POOL_SIZE = 32  # keep-alive connections kept per host
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
 VALID_PAGE_SIZES = {10, 20, 50, 100, 200, 500, 1000}
 
+# CSS selectors are compiled once and reused for every fetched page.
+TOKEN_SELECTOR = soupsieve.compile(
+    'form#__AjaxAntiForgeryForm input[name="__RequestVerificationToken"]'
+)
+RESULT_COUNT_SELECTOR = soupsieve.compile("#searchResultCount")
+PAGE_COUNT_SELECTOR = soupsieve.compile("#NumPages")
+PUBLICATION_SELECTOR = soupsieve.compile("a.pubDetail")
+
 
 @dataclass(frozen=True)
 class Record:
@@ -50,25 +75,31 @@ class NSLSLClient:
     def __init__(self, user_agent: str = DEFAULT_USER_AGENT) -> None:
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
+        # urllib3 retries connection errors and throttling/5xx responses with
+        # exponential backoff; the search POSTs are idempotent so they are
+        # retried as well.
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=REQUEST_DELAY,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=None,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
         self._token: str | None = None
 
     def _ensure_token(self) -> str:
         if self._token:
             return self._token
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                resp = self.session.get(SEARCH_ROOT, timeout=REQUEST_TIMEOUT)
-                resp.raise_for_status()
-                break
-            except requests.RequestException as exc:  # noqa: PERF203 benign small map
-                if attempt == MAX_RETRIES:
-                    raise RuntimeError("Failed to load NSLSL search page") from exc
-                backoff = REQUEST_DELAY * attempt
-                time.sleep(backoff)
-        soup = BeautifulSoup(resp.text, "html.parser")
-        token_field = soup.select_one(
-            'form#__AjaxAntiForgeryForm input[name="__RequestVerificationToken"]'
-        )
+        try:
+            resp = self.session.get(SEARCH_ROOT, timeout=REQUEST_TIMEOUT)
+            resp.raise_for_status()
+        except requests.RequestException as exc:
+            raise RuntimeError("Failed to load NSLSL search page") from exc
+        soup = BeautifulSoup(resp.text, HTML_PARSER)
+        token_field = TOKEN_SELECTOR.select_one(soup)
         if not token_field or not token_field.get("value"):
             raise RuntimeError("Unable to find anti-forgery token on NSLSL search page")
         self._token = token_field["value"]
@@ -78,17 +109,9 @@ class NSLSLClient:
         token = self._ensure_token()
         payload = {"__RequestVerificationToken": token}
         payload.update(data)
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                resp = self.session.post(endpoint, data=payload, timeout=REQUEST_TIMEOUT)
-                resp.raise_for_status()
-                break
-            except requests.RequestException as exc:
-                if attempt == MAX_RETRIES:
-                    raise
-                backoff = REQUEST_DELAY * attempt
-                time.sleep(backoff)
-        return BeautifulSoup(resp.text, "html.parser")
+        resp = self.session.post(endpoint, data=payload, timeout=REQUEST_TIMEOUT)
+        resp.raise_for_status()
+        return BeautifulSoup(resp.text, HTML_PARSER)
 
     def fetch_page(
         self,
@@ -124,15 +147,15 @@ class NSLSLClient:
             "model.SelectAllChecked": "false",
         }
         soup = self._post(endpoint, data)
-        total_elem = soup.select_one("#searchResultCount")
-        total_pages_elem = soup.select_one("#NumPages")
+        total_elem = RESULT_COUNT_SELECTOR.select_one(soup)
+        total_pages_elem = PAGE_COUNT_SELECTOR.select_one(soup)
         if not total_elem or not total_pages_elem:
             raise RuntimeError("Unexpected response structure from NSLSL search")
         total_results = int(total_elem["value"])
         total_pages = int(total_pages_elem["value"])
 
         records: List[Record] = []
-        for anchor in soup.select("a.pubDetail"):
+        for anchor in PUBLICATION_SELECTOR.select(soup):
             pub_id = (anchor.get("data-pubid") or "").strip()
             title = anchor.get_text(strip=True)
             if not pub_id or not title:
@@ -150,6 +173,10 @@ def write_json(records: Sequence[Record], path: str) -> None:
         }
         for record in records
     ]
+    if orjson is not None:
+        with open(path, "wb") as handle:
+            handle.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
     with open(path, "w", encoding="utf-8") as handle:
         json.dump(payload, handle, indent=2)
 
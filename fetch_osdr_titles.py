@@ -16,6 +16,11 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     certifi = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 API_ROOT = "https://visualization.osdr.nasa.gov/biodata/api/"
 TITLE_ENDPOINT = "v2/dataset/*/metadata/study%20title/"
 
@@ -27,8 +32,10 @@ def fetch_json(endpoint: str) -> dict:
     url = f"{API_ROOT}{endpoint}?format=json"
     request = Request(url, headers={"User-Agent": "OSDRTitleFetcher/1.0"})
     with urlopen(request, context=SSL_CONTEXT) as response:  # noqa: S310 - trusted NASA endpoint
-        charset = response.headers.get_content_charset() or "utf-8"
-        payload = response.read().decode(charset)
+        payload = response.read()
+    # Both parsers accept the raw UTF-8 body, so no separate decode pass.
+    if orjson is not None:
+        return orjson.loads(payload)
     return json.loads(payload)
 
 
@@ -53,6 +60,9 @@ def fetch_dataset_titles() -> List[Tuple[str, str]]:
 
 def write_json(titles: Iterable[Tuple[str, str]], output: Path) -> None:
     data = [{"id": ds_id, "title": title} for ds_id, title in titles]
+    if orjson is not None:
+        output.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     output.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
 
@@ -70,23 +70,148 @@ This script requires the external ``requests`` library.  Install it via
 """
 
 import argparse
+import csv
 import json
+import os
 import re
 from html import unescape
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, FrozenSet, List, Optional, Set, Tuple
 import xml.etree.ElementTree as ET
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 
-import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 
 HTML_REQUEST_HEADERS = {
-    "User-Agent": "Mozilla/5.0 (compatible; PMCKeywordBot/1.0; +https://www.ncbi.nlm.nih.gov/pmc/)"
+    "User-Agent": "Mozilla/5.0 (compatible; PMCKeywordBot/1.0; +https://www.ncbi.nlm.nih.gov/pmc/)",
+    "Accept-Encoding": "gzip, deflate",
 }
 EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+_PMCID_RE = re.compile(r"PMC\d+")
+_KW_SPLIT_RE = re.compile(r"[;,\n]\s*")
+_HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+DEFAULT_WORKERS = 4  # CSV rows fetched concurrently
+EFETCH_BATCH_SIZE = 100  # PMCIDs per EFetch request
+# BioC ``section_type`` (upper-cased) -> record field holding its text.
+_SECTION_BUCKETS = {
+    "ABSTRACT": "abstract",
+    "INTRO": "introduction",
+    "BACKGROUND": "introduction",
+    "METHODS": "methods",
+    "MATERIALS AND METHODS": "methods",
+    "METHODOLOGY": "methods",
+    "RESULTS": "results",
+    "FINDINGS": "results",
+    "DISCUSSION": "discussion",
+    "CONCLUSION": "conclusion",
+    "CONCLUSIONS": "conclusion",
+    "CONCLUSIONS/SIGNIFICANCE": "conclusion",
+    "CONCLUDING REMARKS": "conclusion",
+}
+_SECTION_NAMES = ("abstract", "introduction", "methods", "results", "discussion", "conclusion")
+_KEYWORD_SECTION_TYPES = frozenset({"KW", "KEYWORD", "KEYWORDS"})
+# Keyword lookups are memoized so repeated PMCIDs/links never hit the network
+# twice.  Full-text BioC documents are not cached: they are large, and holding
+# them would defeat writing records out as soon as each row finishes.
+KEYWORD_CACHE_SIZE = 10_000
+# NCBI asks clients without an API key to stay at or below 3 requests/s.
+NCBI_REQUESTS_PER_SECOND = 3
+HTTP_RETRIES = 5  # extra attempts after throttling, server errors or timeouts
+HTTP_BACKOFF = 1.0  # seconds; doubled after every failed attempt
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _build_session() -> requests.Session:
+    """Create the shared keep-alive session used by every fetch function.
+
+    All endpoints live on NCBI hosts, so pooling connections avoids a new
+    TCP/TLS handshake per request.  The adapter itself does not retry:
+    :func:`_http_request_with_retry` does, so every attempt passes through
+    the rate limiter.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+    session.mount("https://", adapter)
+    return session
+
+
+class _RateLimiter:
+    """Thread-safe limiter spacing calls at least ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+_SESSION = _build_session()
+_RATE_LIMITER = _RateLimiter(NCBI_REQUESTS_PER_SECOND)
+
+
+def _http_request_with_retry(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request through the shared session, respecting the NCBI rate limit.
+
+    Throttling, transient server errors, timeouts and connection errors are
+    retried up to ``HTTP_RETRIES`` times with exponential backoff, honouring
+    ``Retry-After``.  Every attempt waits on the rate limiter, so retries stay
+    inside the request budget.  An error status left after the last attempt
+    is raised as ``requests.HTTPError``.
+    """
+    attempt = 0
+    while True:
+        _RATE_LIMITER.wait()
+        delay = HTTP_BACKOFF * 2 ** attempt
+        try:
+            response = _SESSION.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= HTTP_RETRIES:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt >= HTTP_RETRIES:
+                response.raise_for_status()
+                return response
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    delay = Retry.DEFAULT.parse_retry_after(retry_after)
+                except InvalidHeader:
+                    pass
+            response.close()
+        attempt += 1
+        time.sleep(delay)
+
+
+def _http_get_with_retry(url: str, **kwargs) -> requests.Response:
+    """GET ``url`` with :func:`_http_request_with_retry`."""
+    return _http_request_with_retry("GET", url, **kwargs)
+
+
+def close_session() -> None:
+    """Close the pooled connections held by the shared session."""
+    _SESSION.close()
 
 
 def extract_pmcid(link: str) -> Optional[str]:
@@ -102,11 +227,19 @@ def extract_pmcid(link: str) -> Optional[str]:
     Optional[str]
         The PMC ID if found, otherwise ``None``.
     """
-    match = re.search(r"PMC\d+", link)
+    # Fast path: PMC links almost always carry the ID at the first "PMC".
+    start = link.find("PMC")
+    if start != -1:
+        end = start + 3
+        while end < len(link) and link[end].isdecimal():
+            end += 1
+        if end > start + 3:
+            return link[start:end]
+    match = _PMCID_RE.search(link)
     return match.group(0) if match else None
 
 
-def fetch_bioc_json(pmcid: str) -> Dict:
+def fetch_bioc_json(pmcid: str, timeout: int = 30) -> Dict:
     """Fetch BioC JSON for a given PMC ID.
 
     Parameters
@@ -114,6 +247,10 @@ def fetch_bioc_json(pmcid: str) -> Dict:
     pmcid: str
         A PMC identifier (e.g. ``PMC4136787``).
 
+    timeout: int, optional
+        Seconds to wait for the connection and for each read; a stalled
+        download is then retried or reported instead of blocking forever.
+
     Returns
     -------
     dict
@@ -127,14 +264,31 @@ def fetch_bioc_json(pmcid: str) -> Dict:
         If the response content cannot be parsed as JSON.
     """
     url = f"https://www.ncbi.nlm.nih.gov/research/bionlp/RESTful/pmcoa.cgi/BioC_json/{pmcid}/unicode"
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
+    response = _http_get_with_retry(url, timeout=timeout)
+    # Parse the raw bytes directly; this skips decoding the body into a str.
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def _section_type(infons: Dict) -> str:
+    """Return the upper-cased ``section_type`` of a passage's ``infons``."""
+    stype = infons.get("section_type")
+    # Many passages carry no section type; skip upper-casing the empty string.
+    return stype.upper() if stype else ""
+
+
+@lru_cache(maxsize=None)
+def _upper_section_types(section_types: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(s.upper() for s in section_types)
 
 
 def merge_section_text(passages: List[Dict], section_types: List[str]) -> str:
     """Concatenate text from passages whose section_type is in ``section_types``.
 
+    :func:`parse_document` no longer uses this (it buckets every section in
+    one pass via ``_SECTION_BUCKETS``); it is kept for existing callers.
+
     Parameters
     ----------
     passages: list of dict
@@ -148,10 +302,9 @@ def merge_section_text(passages: List[Dict], section_types: List[str]) -> str:
         Joined text, separated by blank lines.
     """
     texts = []
-    stypes = {s.upper() for s in section_types}
+    stypes = _upper_section_types(tuple(section_types))
     for p in passages:
-        stype = p.get("infons", {}).get("section_type", "").upper()
-        if stype in stypes:
+        if _section_type(p.get("infons", {})) in stypes:
             text = p.get("text")
             if text:
                 texts.append(text.strip())
@@ -178,14 +331,18 @@ def extract_keywords(passages: List[Dict]) -> List[str]:
     """
     keywords: List[str] = []
     for p in passages:
-        stype = p.get("infons", {}).get("section_type", "").upper()
-        if stype in {"KW", "KEYWORD", "KEYWORDS"}:
-            text = p.get("text", "")
-            # Split on common delimiters
-            for kw in re.split(r"[;,\n]\s*", text):
-                kw = kw.strip()
-                if kw:
-                    keywords.append(kw)
+        if _section_type(p.get("infons", {})) in _KEYWORD_SECTION_TYPES:
+            keywords.extend(_split_keywords(p.get("text", "")))
+    return keywords
+
+
+def _split_keywords(text: str) -> List[str]:
+    """Split a keyword passage on common delimiters, dropping blanks."""
+    keywords: List[str] = []
+    for kw in _KW_SPLIT_RE.split(text):
+        kw = kw.strip()
+        if kw:
+            keywords.append(kw)
     return keywords
 
 
@@ -205,62 +362,108 @@ class _MetaKeywordsParser(HTMLParser):
         content = attr_map.get("content")
         if not content:
             return
-        for kw in re.split(r"[;,\n]\s*", unescape(content)):
+        for kw in _KW_SPLIT_RE.split(unescape(content)):
             kw = kw.strip()
             if kw:
                 self.keywords.append(kw)
 
 
+@lru_cache(maxsize=KEYWORD_CACHE_SIZE)
 def fetch_html_keywords(url: str, timeout: int = 15) -> List[str]:
     """Download PMC article page HTML and extract ``citation_keywords`` entries."""
     try:
-        response = requests.get(url, timeout=timeout, headers=HTML_REQUEST_HEADERS)
-        response.raise_for_status()
+        response = _http_get_with_retry(url, timeout=timeout, headers=HTML_REQUEST_HEADERS)
     except requests.RequestException:
         return []
+    html = response.text
+    # ``citation_keywords`` meta tags live in <head>; skip parsing the body,
+    # which is the bulk of a full-text article page.
+    head_end = _HEAD_END_RE.search(html)
+    if head_end:
+        html = html[: head_end.end()]
     parser = _MetaKeywordsParser()
-    parser.feed(response.text)
+    parser.feed(html)
     parser.close()
     return parser.keywords
 
 
-def fetch_xml_keywords(pmcid: str, timeout: int = 15, retries: int = 3, backoff: float = 1.0) -> List[str]:
+@lru_cache(maxsize=KEYWORD_CACHE_SIZE)
+def fetch_xml_keywords(pmcid: str, timeout: int = 15) -> List[str]:
     """Fetch article metadata via EFetch and extract ``kwd`` entries."""
     pmc_param = pmcid[3:] if pmcid.upper().startswith("PMC") else pmcid
-    attempt = 0
-    while True:
+    try:
+        response = _http_get_with_retry(
+            EFETCH_URL,
+            params={"db": "pmc", "id": pmc_param, "retmode": "xml"},
+            timeout=timeout,
+            headers=HTML_REQUEST_HEADERS,
+        )
+        root = ET.fromstring(response.content)
+    except (requests.RequestException, ET.ParseError):
+        return []
+    return _collect_xml_keywords(root)
+
+
+def fetch_xml_keywords_batch(pmcids: List[str], timeout: int = 60) -> Dict[str, List[str]]:
+    """Fetch EFetch keywords for many articles using one request per batch.
+
+    Returns a mapping from ``PMC``-prefixed identifier to its keywords.
+    Articles whose batch failed, or that are missing from the response, are
+    left out so callers can fall back to :func:`fetch_xml_keywords`.
+    """
+    keywords: Dict[str, List[str]] = {}
+    for start in range(0, len(pmcids), EFETCH_BATCH_SIZE):
+        chunk = pmcids[start:start + EFETCH_BATCH_SIZE]
+        ids = [pmcid[3:] if pmcid.upper().startswith("PMC") else pmcid for pmcid in chunk]
         try:
-            response = requests.get(
+            # POST keeps long ID lists out of the URL; EFetch lookups are
+            # read-only, so retrying them is safe.
+            response = _http_request_with_retry(
+                "POST",
                 EFETCH_URL,
-                params={"db": "pmc", "id": pmc_param, "retmode": "xml"},
+                data={"db": "pmc", "id": ",".join(ids), "retmode": "xml"},
                 timeout=timeout,
-                headers={"User-Agent": HTML_REQUEST_HEADERS["User-Agent"]},
+                headers=HTML_REQUEST_HEADERS,
             )
-            response.raise_for_status()
-            break
-        except requests.RequestException:
-            attempt += 1
-            if attempt >= retries:
-                return []
-            time.sleep(backoff * attempt)
-    try:
-        root = ET.fromstring(response.text)
-    except ET.ParseError:
-        return []
+            root = ET.fromstring(response.content)
+        except (requests.RequestException, ET.ParseError):
+            continue
+        for article in root.iterfind("article"):
+            pmcid = _article_pmcid(article)
+            if pmcid:
+                keywords[pmcid] = _collect_xml_keywords(article)
+    return keywords
+
+
+def _article_pmcid(article: ET.Element) -> Optional[str]:
+    """Return the ``PMC``-prefixed identifier of an EFetch ``article``."""
+    for article_id in article.iterfind("front/article-meta/article-id"):
+        if article_id.get("pub-id-type") in ("pmc", "pmcid"):
+            text = (article_id.text or "").strip().upper()
+            if text:
+                return text if text.startswith("PMC") else f"PMC{text}"
+    return None
+
+
+def _collect_xml_keywords(root: ET.Element) -> List[str]:
+    """Collect keyword-like entries below ``root``.
+
+    Explicit ``kwd`` tags come first, then MeSH descriptor names (typically
+    curated keywords), then subject headings.  ``Element.iter(tag)`` filters
+    by tag in C, so each pass skips the rest of a full-text tree cheaply.
+    """
     keywords: List[str] = []
-    # Prefer explicit keyword tags first.
-    for kw_element in root.findall(".//kwd"):
-        text = "".join(kw_element.itertext()).strip()
-        if text:
-            keywords.append(text)
-    # Fall back to MeSH descriptor names, which are typically curated keywords.
-    for mesh_descriptor in root.findall(".//mesh-heading/descriptor-name"):
-        text = (mesh_descriptor.text or "").strip()
+    for element in root.iter("kwd"):
+        text = "".join(element.itertext()).strip()
         if text:
             keywords.append(text)
-    # Finally, include subject headings when other keyword sources are absent.
-    for subject in root.findall(".//subject"):
-        text = (subject.text or "").strip()
+    for heading in root.iter("mesh-heading"):
+        for descriptor in heading.iterfind("descriptor-name"):
+            text = (descriptor.text or "").strip()
+            if text:
+                keywords.append(text)
+    for element in root.iter("subject"):
+        text = (element.text or "").strip()
         if text:
             keywords.append(text)
     return keywords
@@ -268,19 +471,15 @@ def fetch_xml_keywords(pmcid: str, timeout: int = 15, retries: int = 3, backoff:
 
 def dedupe_keywords(*keyword_lists: List[str]) -> List[str]:
     """Merge multiple keyword lists, preserving order and removing duplicates."""
-    seen = set()
-    merged: List[str] = []
+    # Keyed on the lower-cased keyword; the first spelling seen is kept and
+    # dicts preserve insertion order.
+    merged: Dict[str, str] = {}
     for kw_list in keyword_lists:
         for kw in kw_list:
             normalized = kw.strip()
-            if not normalized:
-                continue
-            key = normalized.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            merged.append(normalized)
-    return merged
+            if normalized:
+                merged.setdefault(normalized.lower(), normalized)
+    return list(merged.values())
 
 
 def extract_citations(passages: List[Dict]) -> List[Dict[str, object]]:
@@ -305,24 +504,35 @@ def extract_citations(passages: List[Dict]) -> List[Dict[str, object]]:
     citations: List[Dict[str, object]] = []
     for p in passages:
         infons = p.get("infons", {})
-        if infons.get("section_type", "").upper() == "REF" and infons.get("type", "") == "ref":
-            title = p.get("text", "").strip()
-            authors: List[str] = []
-            # Extract author names
-            for key, value in infons.items():
-                if key.startswith("name_"):
-                    try:
-                        parts = dict(item.split(":", 1) for item in value.split(";"))
-                    except Exception:
-                        parts = {}
-                    surname = parts.get("surname", "").strip()
-                    given_names = parts.get("given-names", "").strip()
-                    full_name = f"{given_names} {surname}".strip()
-                    authors.append(full_name)
-            citations.append({"title": title, "authors": authors})
+        # The exact ``type`` match is the cheaper test, so it goes first.
+        if infons.get("type") != "ref":
+            continue
+        stype = infons.get("section_type")
+        # BioC emits ``REF`` upper-cased; only other spellings need upper().
+        if stype == "REF" or (stype and stype.upper() == "REF"):
+            citations.append(_citation_from_passage(p, infons))
     return citations
 
 
+def _citation_from_passage(passage: Dict, infons: Dict) -> Dict[str, object]:
+    """Build a citation dictionary from a ``REF`` passage and its ``infons``."""
+    title = passage.get("text", "").strip()
+    authors = [_parse_author(value) for key, value in infons.items() if key.startswith("name_")]
+    return {"title": title, "authors": authors}
+
+
+def _parse_author(value: str) -> str:
+    """Format a ``surname:...;given-names:...`` infon as ``Given Surname``."""
+    surname = given_names = ""
+    for item in value.split(";"):
+        key, _, text = item.partition(":")
+        if key == "surname":
+            surname = text.strip()
+        elif key == "given-names":
+            given_names = text.strip()
+    return f"{given_names} {surname}".strip()
+
+
 def parse_document(doc: Dict) -> Dict[str, object]:
     """Parse a single BioC document into a structured record.
 
@@ -340,31 +550,218 @@ def parse_document(doc: Dict) -> Dict[str, object]:
     record: Dict[str, object] = {}
     pmcid = doc.get("id") or doc.get("infons", {}).get("article-id_pmc")
     record["pmcid"] = pmcid
-    # Extract title from TITLE/front passage
-    title = ""
+    title: Optional[str] = None
+    sections: Dict[str, List[str]] = {name: [] for name in _SECTION_NAMES}
+    keywords: List[str] = []
+    citations: List[Dict[str, object]] = []
+    # Classify every passage in a single pass instead of rescanning the
+    # passage list once per section, keyword and citation extractor.
     for p in passages:
         infons = p.get("infons", {})
-        if infons.get("section_type", "").upper() == "TITLE":
+        stype = _section_type(infons)
+        bucket = _SECTION_BUCKETS.get(stype)
+        if bucket is not None:
+            text = p.get("text")
+            if text:
+                sections[bucket].append(text.strip())
+        elif stype == "TITLE":
+            # The first non-empty TITLE/front passage wins.
             t = p.get("text")
-            if t:
+            if t and title is None:
                 title = t.strip()
-                break
-    record["title"] = title
-    # Sections
-    record["abstract"] = merge_section_text(passages, ["ABSTRACT"])
-    record["introduction"] = merge_section_text(passages, ["INTRO", "BACKGROUND"])
-    record["methods"] = merge_section_text(passages, ["METHODS", "MATERIALS AND METHODS", "METHODOLOGY"])
-    record["results"] = merge_section_text(passages, ["RESULTS", "FINDINGS"])
-    record["discussion"] = merge_section_text(passages, ["DISCUSSION"])
-    record["conclusion"] = merge_section_text(passages, ["CONCLUSION", "CONCLUSIONS", "CONCLUSIONS/SIGNIFICANCE", "CONCLUDING REMARKS"])
-    # Keywords
-    record["keywords"] = extract_keywords(passages)
-    # Citations
-    record["citations"] = extract_citations(passages)
+        elif stype in _KEYWORD_SECTION_TYPES:
+            keywords.extend(_split_keywords(p.get("text", "")))
+        elif stype == "REF" and infons.get("type", "") == "ref":
+            citations.append(_citation_from_passage(p, infons))
+    record["title"] = title or ""
+    for name in _SECTION_NAMES:
+        record[name] = "\n\n".join(sections[name])
+    record["keywords"] = keywords
+    record["citations"] = citations
     return record
 
 
-def process_articles(csv_path: Path, out_path: Path, max_articles: Optional[int] = None, verbose: bool = False) -> None:
+def _process_row(
+    idx: int,
+    link: str,
+    original_title: str,
+    total: int,
+    bioc_executor: ThreadPoolExecutor,
+    prefetched_keywords: Optional[Dict[str, List[str]]] = None,
+) -> Tuple[List[Dict[str, object]], List[str]]:
+    """Fetch and parse a single CSV row.
+
+    Returns the parsed records together with the progress messages for the
+    row, so the caller can print them in input order.  EFetch keywords are
+    taken from ``prefetched_keywords`` when the batch lookup covered the
+    article.
+    """
+    records: List[Dict[str, object]] = []
+    messages: List[str] = []
+    pmcid = extract_pmcid(link)
+    if not pmcid:
+        messages.append(f"[{idx + 1}/{total}] Skipping row without PMCID: {link}")
+        return records, messages
+    messages.append(f"[{idx + 1}/{total}] Fetching {pmcid}...")
+    # Download the (large) BioC document in the background while the
+    # keyword endpoints are queried, overlapping their round-trips.
+    bioc_future = bioc_executor.submit(fetch_bioc_json, pmcid)
+    xml_keywords = (prefetched_keywords or {}).get(pmcid)
+    if xml_keywords is None:
+        xml_keywords = fetch_xml_keywords(pmcid)
+    if xml_keywords:
+        messages.append(f"    Retrieved {len(xml_keywords)} keywords via EFetch.")
+    else:
+        messages.append("    No keywords found via EFetch.")
+    html_keywords: List[str] = []
+    if not xml_keywords and isinstance(link, str) and link:
+        html_keywords = fetch_html_keywords(link)
+        if html_keywords:
+            messages.append(f"    Retrieved {len(html_keywords)} keywords from HTML metadata.")
+        else:
+            messages.append("    No keywords found in HTML metadata.")
+    try:
+        bioc = bioc_future.result()
+    except requests.HTTPError as e:
+        messages.append(f"Failed to fetch {pmcid}: {e}")
+        return records, messages
+    except Exception as e:
+        messages.append(f"Unexpected error fetching {pmcid}: {e}")
+        return records, messages
+    # Each result is a list of collections; we expect one collection containing documents
+    try:
+        collections = bioc if isinstance(bioc, list) else [bioc]
+        for col in collections:
+            documents = col.get("documents", [])
+            for doc in documents:
+                record = parse_document(doc)
+                record["keywords"] = dedupe_keywords(
+                    record.get("keywords", []), xml_keywords, html_keywords
+                )
+                record["original_title"] = original_title
+                records.append(record)
+    except Exception as e:
+        messages.append(f"Error parsing {pmcid}: {e}")
+    return records, messages
+
+
+def _normalise_pmcid(value: object) -> str:
+    """Return ``value`` as an upper-case ``PMC``-prefixed identifier."""
+    text = str(value or "").strip().upper()
+    if not text:
+        return ""
+    return text if text.startswith("PMC") else f"PMC{text}"
+
+
+class _NotJsonLinesError(ValueError):
+    """Raised when ``--jsonl`` is pointed at a file that is not JSON Lines."""
+
+
+def _load_seen_pmcids(out_path: Path) -> Set[str]:
+    """Collect the PMCIDs already present in a JSON Lines output file.
+
+    A trailing line without a newline is what an interrupted run leaves
+    behind; it is truncated so new records start on a fresh line.  Any other
+    content (e.g. a JSON array written without ``--jsonl``) raises
+    ``_NotJsonLinesError`` before the file is modified.
+    """
+    seen: Set[str] = set()
+    if not out_path.exists():
+        return seen
+    not_jsonl = _NotJsonLinesError(
+        f"{out_path} is not a JSON Lines file (was it written without --jsonl?); "
+        "choose another --out or remove the file"
+    )
+    with out_path.open("r+b") as f:
+        complete = 0
+        first_content = True
+        for line in f:
+            stripped = line.strip()
+            if stripped and first_content:
+                if stripped.startswith(b"["):
+                    raise not_jsonl
+                first_content = False
+            if not line.endswith(b"\n"):
+                f.truncate(complete)
+                break
+            complete += len(line)
+            if not stripped:
+                continue
+            try:
+                record = orjson.loads(stripped) if orjson is not None else json.loads(stripped)
+            except ValueError:
+                raise not_jsonl from None
+            if not isinstance(record, dict):
+                raise not_jsonl
+            pmcid = _normalise_pmcid(record.get("pmcid"))
+            if pmcid:
+                seen.add(pmcid)
+    return seen
+
+
+def _dump_record(record: Dict[str, object], indent: bool) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(record, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+class _RecordWriter:
+    """Write records to ``out_path`` as they are produced.
+
+    In JSON Lines mode each record is appended on its own line and flushed so
+    an interrupted run can be resumed.  Otherwise the records are streamed as
+    an indented JSON array, matching what a single ``dump`` of the full list
+    would produce, into a sibling temporary file that only replaces
+    ``out_path`` once the run completes.
+    """
+
+    def __init__(self, out_path: Path, jsonl: bool) -> None:
+        self.out_path = out_path
+        self.jsonl = jsonl
+        self.count = 0
+        if jsonl:
+            self._file = out_path.open("ab")
+            self._tmp_path: Optional[Path] = None
+        else:
+            self._tmp_path = out_path.with_name(f".{out_path.name}.tmp")
+            self._file = self._tmp_path.open("wb")
+
+    def write(self, record: Dict[str, object]) -> None:
+        if self.jsonl:
+            self._file.write(_dump_record(record, indent=False))
+            self._file.write(b"\n")
+            self._file.flush()
+        else:
+            # Serialized JSON never contains raw newlines inside strings, so
+            # nesting the record one level deeper is a plain re-indent.
+            self._file.write(b",\n  " if self.count else b"[\n  ")
+            self._file.write(_dump_record(record, indent=True).replace(b"\n", b"\n  "))
+        self.count += 1
+
+    def close(self, complete: bool = True) -> None:
+        """Finish the output; an incomplete array run leaves ``out_path`` untouched."""
+        if self._tmp_path is None:
+            self._file.close()
+            return
+        try:
+            if complete:
+                self._file.write(b"\n]" if self.count else b"[]")
+            self._file.close()
+            if complete:
+                os.replace(self._tmp_path, self.out_path)
+        finally:
+            # Already gone after a successful replace.
+            self._tmp_path.unlink(missing_ok=True)
+
+
+def process_articles(
+    csv_path: Path,
+    out_path: Path,
+    max_articles: Optional[int] = None,
+    verbose: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    jsonl: bool = False,
+) -> None:
     """Process articles from a CSV file and write structured JSON records.
 
     Parameters
@@ -381,79 +778,82 @@ def process_articles(csv_path: Path, out_path: Path, max_articles: Optional[int]
 
     verbose: bool, optional
         If ``True``, print progress messages.
+
+    workers: int, optional
+        Number of rows fetched concurrently.  Records are still written in
+        CSV order.
+
+    jsonl: bool, optional
+        If ``True``, append one record per line to ``out_path`` instead of
+        writing a JSON array.  Articles already present in the file are
+        skipped, so an interrupted run can simply be restarted.
     """
-    df = pd.read_csv(csv_path)
-    records: List[Dict[str, object]] = []
-    xml_keyword_cache: Dict[str, List[str]] = {}
-    html_keyword_cache: Dict[str, List[str]] = {}
-    total = len(df) if max_articles is None else min(len(df), max_articles)
-    for idx, row in df.iterrows():
-        if max_articles is not None and idx >= max_articles:
-            break
-        link = row.get("Link", "")
+    # Only two columns are needed, so the stdlib reader is plenty; the
+    # ``utf-8-sig`` codec drops the BOM some exports start with.
+    with Path(csv_path).open(newline="", encoding="utf-8-sig") as fh:
+        rows = [
+            (row.get("Link") or "", row.get("Title") or "")
+            for row in islice(csv.DictReader(fh), max_articles)
+        ]
+    total = len(rows)
+    out_path = Path(out_path)
+    seen_pmcids = _load_seen_pmcids(out_path) if jsonl else set()
+    workers = max(1, workers)
+    # Bound the number of queued rows so finished results are written and
+    # released instead of accumulating until the whole CSV has been fetched.
+    max_pending = workers * 2
+    # Pre-scan the rows so EFetch keywords can be requested in batches
+    # instead of one round-trip per article.
+    pmcids = []
+    for link, _ in rows:
         pmcid = extract_pmcid(link)
-        if not pmcid:
-            if verbose:
-                print(f"[{idx + 1}/{total}] Skipping row without PMCID: {link}")
-            continue
+        if pmcid and _normalise_pmcid(pmcid) not in seen_pmcids:
+            pmcids.append(pmcid)
+    xml_keywords = fetch_xml_keywords_batch(list(dict.fromkeys(pmcids)))
+    writer = _RecordWriter(out_path, jsonl)
+
+    def emit(future) -> None:
+        row_records, messages = future.result()
         if verbose:
-            print(f"[{idx + 1}/{total}] Fetching {pmcid}...")
-        xml_keywords: List[str] = []
-        if pmcid:
-            cached_xml = xml_keyword_cache.get(pmcid)
-            if cached_xml is None:
-                cached_xml = fetch_xml_keywords(pmcid)
-                xml_keyword_cache[pmcid] = cached_xml
-                if verbose:
-                    if cached_xml:
-                        print(f"    Retrieved {len(cached_xml)} keywords via EFetch.")
-                    else:
-                        print("    No keywords found via EFetch.")
-            xml_keywords = cached_xml
-        html_keywords: List[str] = []
-        if not xml_keywords and isinstance(link, str) and link:
-            cached_html = html_keyword_cache.get(link)
-            if cached_html is None:
-                cached_html = fetch_html_keywords(link)
-                html_keyword_cache[link] = cached_html
-                if verbose:
-                    if cached_html:
-                        print(f"    Retrieved {len(cached_html)} keywords from HTML metadata.")
-                    else:
-                        print("    No keywords found in HTML metadata.")
-            html_keywords = cached_html
-        try:
-            bioc = fetch_bioc_json(pmcid)
-        except requests.HTTPError as e:
-            if verbose:
-                print(f"Failed to fetch {pmcid}: {e}")
-            continue
-        except Exception as e:
-            if verbose:
-                print(f"Unexpected error fetching {pmcid}: {e}")
-            continue
-        # Each result is a list of collections; we expect one collection containing documents
-        try:
-            collections = bioc if isinstance(bioc, list) else [bioc]
-            for col in collections:
-                documents = col.get("documents", [])
-                for doc in documents:
-                    record = parse_document(doc)
-                    record["keywords"] = dedupe_keywords(
-                        record.get("keywords", []), xml_keywords, html_keywords
+            for message in messages:
+                print(message)
+        for record in row_records:
+            writer.write(record)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as bioc_executor, \
+                ThreadPoolExecutor(max_workers=workers) as row_executor:
+            pending: Deque = deque()
+            for idx, (link, original_title) in enumerate(rows):
+                pmcid = extract_pmcid(link)
+                if seen_pmcids and _normalise_pmcid(pmcid) in seen_pmcids:
+                    # Queue the skip like any other row so verbose output
+                    # stays in CSV order.
+                    skipped: Future = Future()
+                    skipped.set_result(([], [f"[{idx + 1}/{total}] Skipping {pmcid}, already in {out_path}"]))
+                    pending.append(skipped)
+                else:
+                    pending.append(
+                        row_executor.submit(
+                            _process_row,
+                            idx,
+                            link,
+                            original_title,
+                            total,
+                            bioc_executor,
+                            xml_keywords,
+                        )
                     )
-                    record["original_title"] = row.get("Title", "")
-                    records.append(record)
-        except Exception as e:
-            if verbose:
-                print(f"Error parsing {pmcid}: {e}")
-            continue
-    # Write out JSON
-    out_path = Path(out_path)
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(records, f, ensure_ascii=False, indent=2)
+                if len(pending) >= max_pending:
+                    emit(pending.popleft())
+            while pending:
+                emit(pending.popleft())
+    except BaseException:
+        writer.close(complete=False)
+        raise
+    writer.close()
     if verbose:
-        print(f"Wrote {len(records)} records to {out_path}")
+        print(f"Wrote {writer.count} records to {out_path}")
 
 
 def main() -> None:
@@ -462,8 +862,22 @@ def main() -> None:
     parser.add_argument("--out", type=Path, required=True, help="Path to the output JSON file")
     parser.add_argument("--max", type=int, default=None, help="Maximum number of articles to process (for testing)")
     parser.add_argument("--verbose", action="store_true", help="Print progress messages")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of articles fetched concurrently")
+    parser.add_argument("--jsonl", action="store_true", help="Append records as JSON Lines and skip articles already in the output file")
     args = parser.parse_args()
-    process_articles(args.csv, args.out, max_articles=args.max, verbose=args.verbose)
+    try:
+        process_articles(
+            args.csv,
+            args.out,
+            max_articles=args.max,
+            verbose=args.verbose,
+            workers=args.workers,
+            jsonl=args.jsonl,
+        )
+    except _NotJsonLinesError as exc:
+        parser.error(str(exc))
+    finally:
+        close_session()
 
 
 if __name__ == "__main__":